@@ -15,18 +15,24 @@ logging.basicConfig(filename='bot.log', level=logging.INFO,
                     format='%(asctime)s %(levelname)s:%(message)s')
 
 from blockchain import get_token_balance, buy_token
-from filters import check_rugcheck, check_bundled_supply, check_fake_volume
-from utils import send_telegram_message, get_developer_address, load_blacklists, save_blacklists, get_token_data
+from filters import check_fake_volume
+from utils import send_telegram_message, load_blacklists, save_blacklists
+from state import STATE_STORE, start_state_server
+from chains import load_adapters, fetch_token_data
 
-def fetch_data():
+def fetch_data(chain_ids):
     try:
         API_URL = DEXSCREENER.get('latest')
         response = requests.get(API_URL)
         if response.status_code == 200:
             logging.info('Data fetched successfully from Dexscreener.')
             data = response.json()
-            tokens = [token for token in data if token.get('chainId') == 'solana']
-            return {'tokens': tokens}
+            tokens_by_chain = {}
+            for token in data:
+                chain_id = token.get('chainId')
+                if chain_id in chain_ids:
+                    tokens_by_chain.setdefault(chain_id, []).append(token)
+            return {'chains': tokens_by_chain}
         else:
             logging.error('Failed to fetch data: %s', response.status_code)
             return None
@@ -35,7 +41,8 @@ def fetch_data():
         return None
 
 
-def apply_filters(coin):
+def apply_filters(coin, adapter):
+    """Return whether the coin passes, and its developer address if it was looked up."""
     market_cap = coin.get('fdv', 0)
     volume_24h = coin.get('volume', {}).get('h24', 0)
     token_address = coin.get('tokenAddress', '')
@@ -44,42 +51,58 @@ def apply_filters(coin):
         market_cap = float(market_cap)
         volume_24h = float(volume_24h)
     except (ValueError, TypeError):
-        return False
+        STATE_STORE.set_verdict(token_address, 'valid_data', False)
+        return False, None
 
-    if token_address in COIN_BLACKLIST:
+    coin_blacklisted = token_address in COIN_BLACKLIST
+    STATE_STORE.set_verdict(token_address, 'coin_blacklist', not coin_blacklisted)
+    if coin_blacklisted:
         logging.info('Coin %s is in the blacklist. Skipping...', token_address)
-        return False
+        return False, None
 
-    developer_address = get_developer_address(token_address)
-    if developer_address and developer_address.lower() in DEV_BLACKLIST:
+    developer_address = adapter.get_developer_address(token_address)
+    dev_blacklisted = bool(developer_address) and developer_address.lower() in DEV_BLACKLIST
+    STATE_STORE.set_verdict(token_address, 'dev_blacklist', not dev_blacklisted)
+    if dev_blacklisted:
         logging.info('Developer %s is blacklisted. Skipping coin %s...', developer_address, token_address)
-        return False
+        return False, developer_address
 
-    if not check_rugcheck(token_address):
+    # Adapters return None for checks their chain does not support
+    rugcheck_passed = adapter.check_rugcheck(token_address)
+    STATE_STORE.set_verdict(token_address, 'rugcheck', rugcheck_passed)
+    if rugcheck_passed is False:
         logging.info('Coin %s failed RugCheck. Skipping...', token_address)
-        return False
+        return False, developer_address
 
-    if check_bundled_supply(token_address):
+    bundled_supply = adapter.check_bundled_supply(token_address)
+    STATE_STORE.set_verdict(token_address, 'bundled_supply', None if bundled_supply is None else not bundled_supply)
+    if bundled_supply:
         logging.info('Coin %s has bundled supply. Adding to blacklists and skipping...', token_address)
         COIN_BLACKLIST.add(token_address)
         # Add developer to blacklist if is not the pump developer
         if developer_address and developer_address.lower() != 'tslvdd1pwphvjahspsvcxubgwsl3jacvokwakt1eokm':
             DEV_BLACKLIST.add(developer_address.lower())
-        return False
+        return False, developer_address
 
-    if market_cap < FILTERS.get('min_market_cap', 0):
+    market_cap_passed = market_cap >= FILTERS.get('min_market_cap', 0)
+    STATE_STORE.set_verdict(token_address, 'min_market_cap', market_cap_passed)
+    if not market_cap_passed:
         logging.info('Coin %s does not meet the minimum market cap filter. Skipping...', token_address)
-        return False
+        return False, developer_address
 
-    if volume_24h < FILTERS.get('min_volume_24h', 0):
+    volume_passed = volume_24h >= FILTERS.get('min_volume_24h', 0)
+    STATE_STORE.set_verdict(token_address, 'min_volume_24h', volume_passed)
+    if not volume_passed:
         logging.info('Coin %s does not meet the minimum 24h volume filter. Skipping...', token_address)
-        return False
+        return False, developer_address
 
-    if check_fake_volume(coin):
+    fake_volume = check_fake_volume(coin)
+    STATE_STORE.set_verdict(token_address, 'fake_volume', not fake_volume)
+    if fake_volume:
         logging.info('Coin %s suspected of having fake volume. Skipping...', token_address)
-        return False
+        return False, developer_address
 
-    return True
+    return True, developer_address
 
 def detect_events(coin):
     event = None
@@ -92,7 +115,7 @@ def detect_events(coin):
         price_change_1h = float(price_change_1h)
         price_change_24h = float(price_change_24h)
         market_cap = float(market_cap)
-    except ValueError:
+    except (ValueError, TypeError):
         price_change_1h = 0
         price_change_24h = 0
         market_cap = 0
@@ -108,60 +131,109 @@ def detect_events(coin):
 
     return event
 
-async def process_data(data, engine):
-    if not data or 'tokens' not in data:
-        logging.error('No data to process.')
-        return
+def enrich_token(token, adapter):
+    """Fetch, filter and classify a single token. Runs on the chain's worker pool."""
+    token_address = token.get('tokenAddress', '')
 
-    tokens = data['tokens']
-    processed_tokens = []
+    # Verdicts from a previous cycle must not outlive this evaluation
+    STATE_STORE.clear_verdicts(token_address)
+
+    # Fetch additional token data
+    token_data = adapter.get_token_data(token_address)
+    STATE_STORE.set_verdict(token_address, 'data_fetch', bool(token_data))
+    if not token_data:
+        STATE_STORE.set_event(token_address, None)
+        return None
 
-    for token in tokens:
-        token_address = token.get('tokenAddress', '')
+    token = {**token, **token_data}
+    STATE_STORE.update_token(token_address, token, adapter.chain_id)
+
+    # Detect events before filtering so filtered-out tokens don't keep a stale event
+    event = detect_events(token)
+    STATE_STORE.set_event(token_address, event)
+
+    # Apply Filters and Blacklists
+    passed, developer_address = apply_filters(token, adapter)
+    if not passed:
+        return None
+
+    coin_data = {
+        'token_address': token_address,
+        'name': token.get('name'),
+        'symbol': token.get('symbol'),
+        'price': token.get('price', 0),
+        'price_change_1h': token.get('priceChange', {}).get('h1', 0),
+        'price_change_24h': token.get('priceChange', {}).get('h24', 0),
+        'volume_24h': token.get('volume', {}).get('h24', 0),
+        'market_cap': token.get('fdv', 0),
+        'developer': developer_address,
+        'timestamp': datetime.utcnow(),
+        'event_type': None,
+        'is_held': False
+    }
+
+    if event:
+        coin_data['event_type'] = event
+        logging.info('Event detected for %s: %s', coin_data['symbol'], event)
+
+    return coin_data
+
+async def process_chain(adapter, tokens):
+    loop = asyncio.get_running_loop()
+    results = await asyncio.gather(
+        *(loop.run_in_executor(adapter.executor, enrich_token, token, adapter) for token in tokens),
+        return_exceptions=True
+    )
+
+    processed_tokens = []
 
-        # Fetch additional token data
-        token_data = get_token_data(token_address)
+    for coin_data in results:
+        if isinstance(coin_data, Exception):
+            logging.error('Error processing %s token: %s', adapter.chain_id, coin_data)
+            continue
+        if not coin_data:
+            continue
 
-        token = {**token, **token_data}
+        token_address = coin_data['token_address']
+        developer_address = coin_data['developer']
+        event = coin_data['event_type']
 
-        # Apply Filters and Blacklists
-        if not apply_filters(token):
+        # Workers run concurrently, so a developer blacklisted by another token
+        # in this batch may have passed apply_filters. Re-check before trading.
+        if developer_address and developer_address.lower() in DEV_BLACKLIST:
+            logging.info('Developer %s was blacklisted during this batch. Skipping coin %s...', developer_address, token_address)
+            STATE_STORE.set_verdict(token_address, 'dev_blacklist', False)
             continue
 
-        developer_address = get_developer_address(token_address)
-
-        coin_data = {
-            'token_address': token_address,
-            'name': token.get('name'),
-            'symbol': token.get('symbol'),
-            'price': token.get('price', 0),
-            'price_change_1h': token.get('priceChange', {}).get('h1', 0),
-            'price_change_24h': token.get('priceChange', {}).get('h24', 0),
-            'volume_24h': token.get('volume', {}).get('h24', 0),
-            'market_cap': token.get('fdv', 0),
-            'developer': developer_address,
-            'timestamp': datetime.utcnow(),
-            'event_type': None,
-            'is_held': False
-        }
-
-        # Detect events
-        event = detect_events(token)
-        if event:
-            coin_data['event_type'] = event
-            logging.info('Event detected for %s: %s', coin_data['symbol'], event)
-
-            # Execute trade based on event
-            if TRADING.get('enabled', False):
-                if event == 'pump':
-                    # Buy token
-                    await buy_token(token_address)
-                    coin_data['is_held'] = True
-                # Add more conditions as needed
-
-        if coin_data['event_type'] == 'pump':
+        # Execute trade based on event
+        if TRADING.get('enabled', False) and adapter.supports_trading:
+            if event == 'pump':
+                # Buy token
+                await buy_token(token_address)
+                coin_data['is_held'] = True
+                STATE_STORE.set_held(token_address, True)
+            # Add more conditions as needed
+
+        if event == 'pump':
             processed_tokens.append(coin_data)
 
+    logging.info('Processed %d %s tokens, %d met the criteria.', len(tokens), adapter.chain_id, len(processed_tokens))
+    return processed_tokens
+
+async def process_data(data, engine, adapters):
+    if not data or 'chains' not in data:
+        logging.error('No data to process.')
+        return
+
+    # Each chain runs on its own worker pool, so chains are enriched in parallel
+    results = await asyncio.gather(*(
+        process_chain(adapters[chain_id], tokens)
+        for chain_id, tokens in data['chains'].items()
+        if chain_id in adapters
+    ))
+
+    processed_tokens = [coin_data for chain_tokens in results for coin_data in chain_tokens]
+
     if not processed_tokens:
         logging.info('No coins met the criteria after filtering.')
         return
@@ -180,6 +252,7 @@ async def process_data(data, engine):
 async def process_held_tokens(engine):
     """Process held tokens to check for rug_pull events and sell if necessary."""
     held_tokens = fetch_held_tokens(engine)
+    STATE_STORE.reset_held(token_record['token_address'] for token_record in held_tokens)
     if not held_tokens:
         logging.info('No held tokens to process.')
         return
@@ -190,13 +263,16 @@ async def process_held_tokens(engine):
         logging.info('Processing held token: %s (%s)', symbol, token_address)
 
         # Fetch current token data
-        token_data = get_token_data(token_address)
+        token_data = fetch_token_data(token_address)
         if not token_data:
             logging.error('Failed to fetch data for held token: %s', token_address)
             continue
 
+        STATE_STORE.update_token(token_address, token_data)
+
         # Detect current events
         current_event = detect_events(token_data)
+        STATE_STORE.set_event(token_address, current_event)
 
         if current_event == 'rug_pull':
             # Execute sell action
@@ -217,6 +293,7 @@ async def process_held_tokens(engine):
                 with engine.connect() as connection:
                     connection.execute(update_stmt)
                     logging.info('Sold held token: %s (%s) due to rug_pull event.', symbol, token_address)
+                STATE_STORE.set_held(token_address, False)
             except Exception as e:
                 logging.error('Error updating held token status: %s', e)
         else:
@@ -225,28 +302,43 @@ async def process_held_tokens(engine):
 
 async def main():
     load_blacklists()
+    adapters = load_adapters()
     engine = get_engine()
     create_tables(engine)
 
+    # Held status in the snapshot may be stale; the coins table is authoritative
+    STATE_STORE.load_snapshot()
+    STATE_STORE.reset_held(token_record['token_address'] for token_record in fetch_held_tokens(engine))
+    start_state_server()
+
     try:
         while True:
-            data = fetch_data()
+            data = fetch_data(adapters.keys())
             if data:
-                await process_data(data, engine)
+                await process_data(data, engine, adapters)
 
                 # Process held tokens
                 await process_held_tokens(engine)
             else:
                 logging.error('No data fetched.')
+
+            STATE_STORE.evict_stale()
+            STATE_STORE.save_snapshot()
             # Wait for 1 hour before next fetch
             await asyncio.sleep(3600)
     except KeyboardInterrupt:
         save_blacklists()
+        STATE_STORE.save_snapshot()
+        for adapter in adapters.values():
+            adapter.shutdown()
         logging.info('Bot stopped by user.')
         sys.exit(0)
     except Exception as e:
         logging.error('Unexpected error: %s', e)
         save_blacklists()
+        STATE_STORE.save_snapshot()
+        for adapter in adapters.values():
+            adapter.shutdown()
         sys.exit(1)
 
 if __name__ == '__main__':
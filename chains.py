@@ -0,0 +1,110 @@
+import time
+import logging
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+
+from config import CHAINS, DEXSCREENER, RUGCHECK
+from filters import check_rugcheck, check_bundled_supply
+from utils import get_developer_address, get_token_data
+
+class RateLimiter:
+    """Spaces calls so that at most `rate` of them start per second."""
+
+    def __init__(self, rate: float):
+        self.interval = 1 / rate if rate else 0
+        self._lock = threading.Lock()
+        self._next = 0
+
+    def wait(self) -> None:
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            delay = max(0, self._next - now)
+            self._next = max(now, self._next) + self.interval
+        if delay:
+            time.sleep(delay)
+
+
+# Dexscreener and RugCheck are shared by every chain, so their budgets are too
+DEXSCREENER_LIMITER = RateLimiter(DEXSCREENER.get('requests_per_second', 0))
+RUGCHECK_LIMITER = RateLimiter(RUGCHECK.get('requests_per_second', 0))
+
+def fetch_token_data(token_address: str):
+    DEXSCREENER_LIMITER.wait()
+    return get_token_data(token_address)
+
+
+class ChainAdapter:
+    """Chain-specific enrichment and checks used by the bot.
+
+    Each adapter owns its own worker pool and RPC rate-limit budget, so a slow
+    or throttled chain does not hold back the others. Checks a chain does not
+    support return None so they are reported as skipped, not passed.
+    """
+
+    chain_id = None
+    supports_trading = False
+
+    def __init__(self, settings: dict):
+        self.settings = settings
+        self.limiter = RateLimiter(settings.get('requests_per_second', 0))
+        self.executor = ThreadPoolExecutor(
+            max_workers=settings.get('workers', 1),
+            thread_name_prefix=f'{self.chain_id}-worker',
+        )
+
+    def get_token_data(self, token_address: str):
+        return fetch_token_data(token_address)
+
+    def get_developer_address(self, token_address: str):
+        return None
+
+    def check_rugcheck(self, token_address: str):
+        return None
+
+    def check_bundled_supply(self, token_address: str):
+        return None
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=False)
+
+
+class SolanaAdapter(ChainAdapter):
+    chain_id = 'solana'
+    supports_trading = True
+
+    def get_developer_address(self, token_address: str):
+        self.limiter.wait()
+        return get_developer_address(token_address)
+
+    def check_rugcheck(self, token_address: str) -> bool:
+        RUGCHECK_LIMITER.wait()
+        return check_rugcheck(token_address)
+
+    def check_bundled_supply(self, token_address: str) -> bool:
+        # Two RPC calls: largest accounts and token supply
+        self.limiter.wait()
+        self.limiter.wait()
+        return check_bundled_supply(token_address)
+
+
+ADAPTERS = {
+    SolanaAdapter.chain_id: SolanaAdapter,
+}
+
+def load_adapters() -> dict:
+    adapters = {}
+    for chain_id, settings in CHAINS.items():
+        if not settings.get('enabled', False):
+            continue
+
+        adapter_class = ADAPTERS.get(chain_id)
+        if not adapter_class:
+            logging.warning('Chain %s is enabled but has no adapter. Skipping...', chain_id)
+            continue
+
+        adapters[chain_id] = adapter_class(settings)
+        logging.info('Loaded %s adapter with %d workers.', chain_id, settings.get('workers', 1))
+    return adapters
@@ -19,7 +19,8 @@ WALLET = {
 
 DEXSCREENER = {
     'latest': 'https://api.dexscreener.com/token-profiles/latest/v1',
-    'pairs': 'https://api.dexscreener.com/latest/dex/tokens'
+    'pairs': 'https://api.dexscreener.com/latest/dex/tokens',
+    'requests_per_second': 5,        # Shared by every chain
 }
 
 FILTERS = {
@@ -39,6 +40,7 @@ DEV_BLACKLIST = set([
 RUGCHECK = {
     'enabled': True,
     'api_url': lambda x : f'https://api.rugcheck.xyz/v1/tokens/{x}/report/summary',
+    'requests_per_second': 5,        # Shared by every chain
 }
 
 TELEGRAM = {
@@ -54,3 +56,19 @@ TRADING = {
 SOLANA = {
     'url': 'https://api.mainnet-beta.solana.com',
 }
+
+CHAINS = {
+    'solana': {
+        'enabled': True,
+        'workers': 4,                # Concurrent enrichment workers for this chain
+        'requests_per_second': 10,   # RPC request budget for this chain
+    },
+}
+
+STATE = {
+    'api_enabled': True,
+    'host': '127.0.0.1',             # Bind locally only; the API is read-only
+    'port': 8765,
+    'snapshot_file': 'state_snapshot.json',
+    'max_record_age': 7 * 24 * 3600, # Evict tokens not seen for this long (held tokens are kept)
+}
@@ -0,0 +1,299 @@
+import os
+import json
+import time
+import logging
+import threading
+
+from urllib.parse import urlparse, parse_qs
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from config import STATE
+
+class StateStore:
+    """In-process view of the latest known state of every token seen by the bot.
+
+    Records are keyed by token address and indexed by event type and held flag,
+    so lookups never touch the database or the upstream APIs.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._records = {}
+        self._by_event = {}
+        self._held = set()
+
+    def _record(self, token_address: str) -> dict:
+        record = self._records.get(token_address)
+        if record is None:
+            record = {
+                'token_address': token_address,
+                'chain_id': None,
+                'data': {},
+                'data_updated_at': None,
+                'verdicts': {},
+                'event_type': None,
+                'is_held': False,
+                'updated_at': None,
+            }
+            self._records[token_address] = record
+        return record
+
+    def _set_event(self, record: dict, event_type) -> None:
+        old = record['event_type']
+        if old == event_type:
+            return
+        if old is not None:
+            addresses = self._by_event.get(old)
+            if addresses is not None:
+                addresses.discard(record['token_address'])
+                if not addresses:
+                    del self._by_event[old]
+        if event_type is not None:
+            self._by_event.setdefault(event_type, set()).add(record['token_address'])
+        record['event_type'] = event_type
+
+    def _set_held(self, record: dict, is_held: bool) -> None:
+        record['is_held'] = bool(is_held)
+        if record['is_held']:
+            self._held.add(record['token_address'])
+        else:
+            self._held.discard(record['token_address'])
+
+    def update_token(self, token_address: str, data: dict, chain_id: str = None) -> None:
+        """Store the latest enriched record for a token."""
+        if not token_address or not data:
+            return
+        now = time.time()
+        with self._lock:
+            record = self._record(token_address)
+            record['data'] = dict(data)
+            record['data_updated_at'] = now
+            record['updated_at'] = now
+            if chain_id or data.get('chainId'):
+                record['chain_id'] = chain_id or data.get('chainId')
+
+    def set_verdict(self, token_address: str, name: str, passed) -> None:
+        """Record the outcome of a single filter check for a token.
+
+        A `passed` of None means the check was not run for this token's chain.
+        """
+        if not token_address:
+            return
+        now = time.time()
+        with self._lock:
+            record = self._record(token_address)
+            record['verdicts'][name] = {
+                'passed': None if passed is None else bool(passed),
+                'checked_at': now,
+            }
+            record['updated_at'] = now
+
+    def clear_verdicts(self, token_address: str) -> None:
+        if not token_address:
+            return
+        with self._lock:
+            record = self._records.get(token_address)
+            if record is not None:
+                record['verdicts'] = {}
+
+    def set_event(self, token_address: str, event_type) -> None:
+        if not token_address:
+            return
+        with self._lock:
+            record = self._record(token_address)
+            self._set_event(record, event_type)
+            record['updated_at'] = time.time()
+
+    def set_held(self, token_address: str, is_held: bool) -> None:
+        if not token_address:
+            return
+        with self._lock:
+            record = self._record(token_address)
+            self._set_held(record, is_held)
+            record['updated_at'] = time.time()
+
+    def reset_held(self, token_addresses) -> None:
+        """Make the held index match exactly the given addresses."""
+        token_addresses = set(token_addresses)
+        now = time.time()
+        with self._lock:
+            for token_address in self._held - token_addresses:
+                self._set_held(self._records[token_address], False)
+                self._records[token_address]['updated_at'] = now
+            for token_address in token_addresses - self._held:
+                record = self._record(token_address)
+                self._set_held(record, True)
+                record['updated_at'] = now
+
+    def evict_stale(self, max_age: float = None) -> None:
+        """Drop records not updated within `max_age` seconds, except held tokens."""
+        max_age = max_age if max_age is not None else STATE.get('max_record_age')
+        if not max_age:
+            return
+        cutoff = time.time() - max_age
+        with self._lock:
+            stale = [
+                token_address for token_address, record in self._records.items()
+                if not record['is_held'] and (record['updated_at'] or 0) < cutoff
+            ]
+            for token_address in stale:
+                self._set_event(self._records[token_address], None)
+                del self._records[token_address]
+        if stale:
+            logging.info('Evicted %d stale tokens from state store.', len(stale))
+
+    def _view(self, record: dict, now: float) -> dict:
+        view = dict(record)
+        view['data_age'] = now - record['data_updated_at'] if record['data_updated_at'] else None
+        view['verdicts'] = {
+            name: {**verdict, 'age': now - verdict['checked_at']}
+            for name, verdict in record['verdicts'].items()
+        }
+        return view
+
+    def get(self, token_address: str):
+        with self._lock:
+            record = self._records.get(token_address)
+            if record is None:
+                return None
+            return self._view(record, time.time())
+
+    def by_event(self, event_type: str) -> list:
+        with self._lock:
+            now = time.time()
+            return [self._view(self._records[a], now) for a in self._by_event.get(event_type, ())]
+
+    def held(self) -> list:
+        with self._lock:
+            now = time.time()
+            return [self._view(self._records[a], now) for a in self._held]
+
+    def all(self) -> list:
+        with self._lock:
+            now = time.time()
+            return [self._view(record, now) for record in self._records.values()]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'tokens': len(self._records),
+                'held': len(self._held),
+                'events': {event: len(addresses) for event, addresses in self._by_event.items()},
+            }
+
+    def save_snapshot(self, path: str = None) -> None:
+        path = path or STATE.get('snapshot_file')
+        with self._lock:
+            data = {'records': list(self._records.values())}
+            try:
+                payload = json.dumps(data, default=str)
+            except Exception as e:
+                logging.error('Error serializing state snapshot: %s', e)
+                return
+        tmp_path = f'{path}.tmp'
+        try:
+            with open(tmp_path, 'w') as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+            logging.info('State snapshot saved to %s.', path)
+        except Exception as e:
+            logging.error('Error saving state snapshot: %s', e)
+
+    def load_snapshot(self, path: str = None) -> None:
+        path = path or STATE.get('snapshot_file')
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            logging.info('No existing state snapshot found. Starting fresh.')
+            return
+        except Exception as e:
+            logging.error('Error loading state snapshot: %s', e)
+            return
+
+        with self._lock:
+            for saved in data.get('records', []):
+                token_address = saved.get('token_address')
+                if not token_address:
+                    continue
+                record = self._record(token_address)
+                record['chain_id'] = saved.get('chain_id')
+                record['data'] = saved.get('data') or {}
+                record['data_updated_at'] = saved.get('data_updated_at')
+                record['verdicts'] = saved.get('verdicts') or {}
+                record['updated_at'] = saved.get('updated_at')
+                self._set_event(record, saved.get('event_type'))
+                self._set_held(record, saved.get('is_held', False))
+        logging.info('State snapshot loaded from %s (%d tokens).', path, len(self._records))
+
+
+STATE_STORE = StateStore()
+
+
+class StateRequestHandler(BaseHTTPRequestHandler):
+    """Read-only JSON API over STATE_STORE.
+
+    GET /tokens                 all tokens
+    GET /tokens/<address>       a single token
+    GET /tokens?event=<type>    tokens with the given event type
+    GET /tokens?held=true       tokens currently held
+    GET /stats                  index counts
+    """
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        parts = [part for part in url.path.split('/') if part]
+        query = parse_qs(url.query)
+
+        if parts == ['stats']:
+            return self._send(200, STATE_STORE.stats())
+
+        if parts and parts[0] == 'tokens':
+            if len(parts) == 2:
+                record = STATE_STORE.get(parts[1])
+                if record is None:
+                    return self._send(404, {'error': 'token not found'})
+                return self._send(200, record)
+
+            if len(parts) == 1:
+                if 'event' in query:
+                    records = STATE_STORE.by_event(query['event'][0])
+                elif query.get('held', [''])[0].lower() in ('1', 'true'):
+                    records = STATE_STORE.held()
+                else:
+                    records = STATE_STORE.all()
+                return self._send(200, records)
+
+        return self._send(404, {'error': 'not found'})
+
+    def _send(self, status: int, body) -> None:
+        payload = json.dumps(body, default=str).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        logging.debug('State API: ' + format, *args)
+
+
+def start_state_server():
+    """Start the state API on a daemon thread and return the server."""
+    if not STATE.get('api_enabled', False):
+        logging.info('State API is disabled.')
+        return None
+
+    host = STATE.get('host', '127.0.0.1')
+    port = STATE.get('port', 8765)
+    try:
+        server = ThreadingHTTPServer((host, port), StateRequestHandler)
+    except OSError as e:
+        logging.error('Failed to start state API on %s:%s: %s', host, port, e)
+        return None
+
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, name='state-api', daemon=True)
+    thread.start()
+    logging.info('State API listening on http://%s:%s', host, port)
+    return server